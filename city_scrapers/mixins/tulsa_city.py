@@ -1,3 +1,4 @@
+import functools
 import re
 from datetime import datetime
 
@@ -11,8 +12,57 @@ from city_scrapers_core.constants import (
 )
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
+from lxml import etree
 from scrapy import FormRequest
 
+from city_scrapers.utils import (
+    GRANICUS_AGENDA_XPATH,
+    GRANICUS_DATE_XPATH,
+    GRANICUS_LISTING_ROW,
+    GRANICUS_LISTING_TABLE,
+    GRANICUS_TITLE_XPATH,
+    GRANICUS_VIDEO_XPATHS,
+    MONTHS,
+    WINDOW_OPEN_RE,
+    json_loads,
+    to_24_hour,
+)
+
+# Meeting times from the Tulsa API, e.g. "5:00PM" or "5:00 PM"
+_TIME_RE = re.compile(r"^\s*(1[0-2]|0?[1-9]):([0-5]\d)\s*([AaPp])[Mm]\s*$")
+
+# Upcoming meeting dates on Granicus, e.g. "January 8, 2026 - 12:00 PM"
+_UPCOMING_DATE_RE = re.compile(
+    r"^([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})\s*-\s*"
+    r"(1[0-2]|0?[1-9]):([0-5]\d)\s*([AaPp])[Mm]$"
+)
+
+# Rows of the Granicus upcoming meetings table
+_UPCOMING_ROWS_XPATH = etree.XPath(
+    f"//{GRANICUS_LISTING_TABLE}[contains(@summary, 'Upcoming')]"
+    f"//tbody//{GRANICUS_LISTING_ROW}"
+)
+
+# Meeting type words indicating the meeting will not happen as scheduled
+_CANCEL_RE = re.compile(r"cancel|reschedule|postpone")
+
+_CLASSIFICATIONS_LOWER = tuple((c, c.lower()) for c in CLASSIFICATIONS)
+
+
+@functools.lru_cache(maxsize=512)
+def _classify(title_lower):
+    """Classification for a lowercased title; most meetings share a few titles."""
+    # Check the meeting type after the first "-" before the board name
+    parts = title_lower.split("-", 2)
+
+    for index in (1, 0):
+        if index < len(parts):
+            for classification, classification_lower in _CLASSIFICATIONS_LOWER:
+                if classification_lower in parts[index]:
+                    return classification
+
+    return NOT_CLASSIFIED
+
 
 class TulsaCityMixinMeta(type):
     """
@@ -45,35 +95,45 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
 
     # Common words to exclude when matching agency names to meeting titles.
     # These words are too generic to be meaningful for matching purposes.
-    STOP_WORDS = {
-        "of",
-        "the",
-        "for",
-        "in",
-        "at",
-        "to",
-        "a",
-        "an",
-        "and",
-        "or",
-        "city",
-        "tulsa",
-        "area",
-        "greater",
-        "commission",
-        "committee",
-        "board",
-        "authority",
-        "trust",
-        "affairs",
-    }
+    STOP_WORDS = frozenset(
+        {
+            "of",
+            "the",
+            "for",
+            "in",
+            "at",
+            "to",
+            "a",
+            "an",
+            "and",
+            "or",
+            "city",
+            "tulsa",
+            "area",
+            "greater",
+            "commission",
+            "committee",
+            "board",
+            "authority",
+            "trust",
+            "affairs",
+        }
+    )
+
+    # Upcoming meeting titles used by Tulsa City Council
+    CITY_COUNCIL_TITLES = (
+        frozenset({"regular", "council", "meeting"}),
+        frozenset({"council", "meeting", "special"}),
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Precompute agency keywords once
         self.agency_keywords = (
-            set(self.agency.replace("-", " ").lower().split()) - self.STOP_WORDS
+            frozenset(self.agency.replace("-", " ").lower().split()) - self.STOP_WORDS
         )
+        # Responses received so far from the API and the upcoming meetings page
+        self._sources = {}
 
     def _is_agency_match(self, title):
         """
@@ -86,21 +146,16 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
         meetings page provides this specific agency's meetings with these
         titles: "Regular Council Meeting" or "Council Meeting Special".
         """
-        row_title = set(title.replace("-", " ").lower().split())
+        words = title.replace("-", " ").lower().split()
 
         # Special case for Tulsa City Council
         if self.name == "tulok_city_council":
-            s1 = {"regular", "council", "meeting"}
-            s2 = {"council", "meeting", "special"}
-            return row_title.issubset(s1) or row_title.issubset(s2)
-
-        row_keywords = row_title - self.STOP_WORDS
+            return any(titles.issuperset(words) for titles in self.CITY_COUNCIL_TITLES)
 
-        title_match = row_keywords.intersection(self.agency_keywords)
-
-        # Need at least 2 meaningful keyword matches
+        # Need at least 2 meaningful keyword matches. Agency keywords never
+        # contain stop words, so the title words don't need filtering.
         min_matches = min(2, len(self.agency_keywords))
-        return len(title_match) >= min_matches
+        return len(self.agency_keywords.intersection(words)) >= min_matches
 
     custom_settings = {
         "ROBOTSTXT_OBEY": False,
@@ -125,7 +180,9 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
         This spider mixin uses a POST request to fetch meeting
         data from the Tulsa meeting API using a board ID which
         is specified in each child spider class. This spider also
-        fetches upcoming meetings from a separate URL.
+        fetches upcoming meetings from a separate URL. Both requests
+        are sent at once, and meetings are parsed once both responses
+        have been received.
         """
         yield FormRequest(
             url=self.api_url,
@@ -133,28 +190,37 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
                 "boardID": str(self.board_id),
                 "subCommitteeID": str(self.sub_committee_id),
             },
-            callback=self.parse_upcoming,
-            meta={"api_data": None},
+            callback=self.parse_api,
         )
+        yield scrapy.Request(self.upcoming_url, callback=self.parse_upcoming)
+
+    def parse_api(self, response):
+        self._sources["api_data"] = self.filter_meetings_data(response)
+        yield from self._parse_sources()
 
     def parse_upcoming(self, response):
-        api_data = self.filter_meetings_data(response)
+        self._sources["granicus_meetings"] = self._get_upcoming_meetings(response)
+        yield from self._parse_sources()
 
-        yield scrapy.Request(
-            self.upcoming_url,
-            callback=self.parse,
-            meta={"api_data": api_data},
-        )
+    def _parse_sources(self):
+        """
+        Parse meetings once both the API data and the upcoming meetings
+        have been received, whichever response arrives last.
+        """
+        if "api_data" not in self._sources or "granicus_meetings" not in self._sources:
+            return
 
-    def parse(self, response):
-        city_api_meetings = response.meta.get("api_data", [])
-        granicus_meetings = self._get_upcoming_meetings(response)
+        yield from self._parse_meetings(
+            self._sources.pop("api_data"), self._sources.pop("granicus_meetings")
+        )
 
+    def _parse_meetings(self, city_api_meetings, granicus_meetings):
         meetings_data = self.filter_duplicates(city_api_meetings, granicus_meetings)
+        now = datetime.now()
 
         for meeting_data in meetings_data:
             if "Annual" not in meeting_data.get("Meeting_Type", ""):
-                meeting = self._parse_meeting(meeting_data)
+                meeting = self._parse_meeting(meeting_data, now=now)
 
                 if meeting:
                     yield meeting
@@ -184,12 +250,12 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
         return filtered_meetings
 
     def _get_upcoming_meetings(self, response):
-        upcoming_table = response.css('table.listingTable[summary*="Upcoming"]')
-        meeting_rows = upcoming_table.css("tbody tr.listingRow")
+        meeting_rows = _UPCOMING_ROWS_XPATH(response.selector.root)
         upcoming_meetings = []
 
         for row in meeting_rows:
-            title = row.css('td.listItem[headers="Name"]::text').get()
+            titles = GRANICUS_TITLE_XPATH(row)
+            title = titles[0] if titles else None
             if not title:
                 continue
 
@@ -205,11 +271,9 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
     def _extract_upcoming_meeting_data(self, row, title, response):
         meeting_data = {}
 
-        agenda_link = row.css(
-            'td.listItem[headers="AgendaLink"] a[href*="AgendaViewer"]::attr(href)'
-        ).get()
-        if agenda_link:
-            meeting_data["Agenda_Link"] = response.urljoin(agenda_link)
+        agenda_links = GRANICUS_AGENDA_XPATH(row)
+        if agenda_links:
+            meeting_data["Agenda_Link"] = response.urljoin(agenda_links[0])
 
         video_link = self._extract_video_link(row, response)
         if video_link:
@@ -226,30 +290,35 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
     def _parse_upcoming_meeting_date(self, row):
         try:
             # This can contain either plain text date or "In Progress" with embedded link  # noqa
-            date_text = (
-                row.css('td.listItem[headers="Date"]').xpath("normalize-space()").get()
-            )
+            date_text = GRANICUS_DATE_XPATH(row)
 
             if not date_text or "In Progress" in date_text:
                 return None
 
-            return datetime.strptime(date_text, "%B %d, %Y - %I:%M %p")
+            match = _UPCOMING_DATE_RE.match(date_text)
+            month = MONTHS.get(match.group(1).lower()) if match else None
+            if month is None:
+                self.logger.warning("Unrecognized upcoming meeting date: %s", date_text)
+                return None
+
+            _, day, year, hour, minute, meridiem = match.groups()
+            return datetime(
+                int(year), month, int(day), to_24_hour(hour, meridiem), int(minute)
+            )
         except Exception as e:
-            self.logger.exception(f"Failed to parse upcoming meeting date: {e}")
+            self.logger.exception("Failed to parse upcoming meeting date: %s", e)
             return None
 
     def _extract_video_link(self, row, response):
-        video_onclick = (
-            row.css(
-                'td.listItem[headers="ViewEventLink"] a[onclick*="MediaPlayer"]::attr(onclick)'  # noqa
-            ).get()
-            or row.css(
-                'td.listItem[headers="Date"] a[onclick*="MediaPlayer"]::attr(onclick)'
-            ).get()
-        )
-
-        if video_onclick:
-            match = re.search(r'window\.open\(\s*[\'"]([^\'"]+)[\'"]', video_onclick)
+        video_onclick = None
+        for video_xpath in GRANICUS_VIDEO_XPATHS:
+            onclicks = video_xpath(row)
+            if onclicks:
+                video_onclick = onclicks[0]
+                break
+
+        if video_onclick and "window.open" in video_onclick:
+            match = WINDOW_OPEN_RE.search(video_onclick)
             if match:
                 return response.urljoin(match.group(1))
 
@@ -260,32 +329,24 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
         This function removes repeated instances of the same meeting
         on the same date and time. Some meetings appear multiple times
         in the API response, but with updated agenda information. In
-        here, only the last instance of such meeting is kept.
+        here, only the last instance of such meeting is kept, in the
+        position where the meeting first appeared.
         """
         try:
-            data = response.json()
-            meetings = []
+            data = json_loads(response.body)
+            meetings_by_date_time = {}
             for meeting_data in data:
-                date_str = meeting_data.get("Meeting_Date", "").strip()
-                time_str = meeting_data.get("Meeting_Time", "").strip()
-
-                date_time_str = date_str + " " + time_str if time_str else date_str
-
-                if meetings and (
-                    meetings[-1].get("Meeting_Date", "").strip()
-                    + " "
-                    + meetings[-1].get("Meeting_Time", "").strip()
-                    == date_time_str
-                ):
-                    meetings[-1] = meeting_data
-                else:
-                    meetings.append(meeting_data)
-            return meetings
+                key = (
+                    meeting_data.get("Meeting_Date", "").strip(),
+                    meeting_data.get("Meeting_Time", "").strip(),
+                )
+                meetings_by_date_time[key] = meeting_data
+            return list(meetings_by_date_time.values())
         except Exception as e:
-            self.logger.error(f"Failed to filter meetings data: {e}")
+            self.logger.error("Failed to filter meetings data: %s", e)
             return []
 
-    def _parse_meeting(self, item):
+    def _parse_meeting(self, item, now=None):
         title = self._parse_title(item)
         start = self._parse_start(item)
 
@@ -302,7 +363,9 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
             source=f"{self.base_url}/government/meeting-agendas/",
         )
 
-        meeting["status"] = self._get_status(meeting, text=item.get("Meeting_Type", ""))
+        meeting["status"] = self._get_status(
+            meeting, text=item.get("Meeting_Type", ""), now=now
+        )
         meeting["id"] = self._get_id(meeting)
 
         return meeting
@@ -326,15 +389,14 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
             return None
 
         # Parse date (format: MM/DD/YYYY)
-        date_obj = datetime.strptime(date_str.strip(), "%m/%d/%Y")
+        month, day, year = date_str.strip().split("/")
+        date_obj = datetime(int(year), int(month), int(day))
 
         # Parse time if available (format: H:MMAM/PM)
-        if time_str:
-            try:
-                time_obj = datetime.strptime(time_str.strip(), "%I:%M%p")
-                return date_obj.replace(hour=time_obj.hour, minute=time_obj.minute)
-            except ValueError:
-                pass
+        match = _TIME_RE.match(time_str) if time_str else None
+        if match:
+            hour, minute, meridiem = match.groups()
+            return date_obj.replace(hour=to_24_hour(hour, meridiem), minute=int(minute))
 
         return date_obj
 
@@ -342,14 +404,7 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
         if not title:
             return NOT_CLASSIFIED
 
-        sub_agencies = [sub_agency.strip().lower() for sub_agency in title.split("-")]
-
-        for part in sub_agencies[1:2] + sub_agencies[0:1]:
-            for classification in CLASSIFICATIONS:
-                if classification.lower() in part:
-                    return classification
-
-        return NOT_CLASSIFIED
+        return _classify(title.lower())
 
     def _parse_links(self, item):
         links = []
@@ -383,17 +438,17 @@ class TulsaCityMixin(CityScrapersSpider, metaclass=TulsaCityMixinMeta):
 
         return links
 
-    def _get_status(self, item, text=""):
+    def _get_status(self, item, text="", now=None):
         if not text:
             return super()._get_status(item)
 
         text_lower = text.lower()
 
         # Check for cancellation indicators
-        if any(word in text_lower for word in ["cancel", "reschedule", "postpone"]):
+        if _CANCEL_RE.search(text_lower):
             return CANCELLED
         elif "special" in text_lower or "regular" in text_lower:
-            if item.get("start") < datetime.now():
+            if item.get("start") < (now or datetime.now()):
                 return PASSED
             return TENTATIVE
 
@@ -25,6 +25,10 @@ AUTOTHROTTLE_TARGET_CONCURRENCY = float(
     os.getenv("AUTOTHROTTLE_TARGET_CONCURRENCY", 1.0)
 )
 
+# Schedule requests by how busy each download slot is, so spiders that hit
+# more than one site don't queue behind a single slow host
+SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.DownloaderAwarePriorityQueue"
+
 # Configure item pipelines
 ITEM_PIPELINES = {
     "city_scrapers_core.pipelines.MeetingPipeline": 200,
@@ -1,10 +1,31 @@
-from datetime import date, datetime
+import functools
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
 
 import scrapy
 from city_scrapers_core.constants import BOARD
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
 
+from city_scrapers.utils import json_loads
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_datetime(dt_str):
+    """Parse an ISO datetime string into a naive datetime object."""
+    # Handle ISO format like '2025-11-19T11:30:00Z'. Drop the "Z" or any
+    # "+HH:MM"/"-HH:MM" offset so the result is already naive
+    if dt_str.endswith("Z"):
+        dt_str = dt_str[:-1]
+    else:
+        offset_start = max(dt_str.rfind("+"), dt_str.rfind("-"))
+        if offset_start > 10:
+            dt_str = dt_str[:offset_start]
+    try:
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        return None
+
 
 class TulokBoccSpider(CityScrapersSpider):
     name = "tulok_bocc"
@@ -14,7 +35,13 @@ class TulokBoccSpider(CityScrapersSpider):
     portal_base_url = "https://tulsacook.portal.civicclerk.com"
     info_page_url = "https://www2.tulsacounty.org/Legacy/agendasdetail_civic.aspx?entity=BOCC%20-%20Board%20of%20County%20Commissioners"  # noqa
     category_filter = "categoryId+in+(26,40)"
+    # Only the event fields used when building meetings
+    select_fields = "id,eventName,eventDescription,startDateTime,endDateTime,eventLocation,publishedFiles"  # noqa
     time_notes = ""
+    page_size = 100
+    custom_settings = {
+        "DOWNLOAD_TIMEOUT": 60,
+    }
 
     def start_requests(self):
         # First fetch the info page using CSS selectors to get time notes
@@ -34,17 +61,29 @@ class TulokBoccSpider(CityScrapersSpider):
         if self.time_notes:
             self.time_notes += " For meetings prior to February 2021, specific location details are only available in the meeting agenda. Note that some meetings may be cancelled as indicated in the agenda, even if the status shows as passed."  # noqa
 
-        # Then fetch the events from the API
-        today = date.today()
-        today_str = today.isoformat()
-        urls = [
-            # all past events up to today
-            f"{self.api_base_url}/v1/Events?$filter=startDateTime+lt+{today_str}+and+{self.category_filter}&$orderby=startDateTime+desc,+eventName+desc",  # noqa
-            # upcoming events (today and future)
-            f"{self.api_base_url}/v1/Events?$filter={self.category_filter}+and+startDateTime+ge+{today_str}&$orderby=startDateTime+asc,+eventName+asc",  # noqa
-        ]
-        for url in urls:
+        # Then fetch all events from the API, past and upcoming, in one query
+        url = f"{self.api_base_url}/v1/Events?$filter={self.category_filter}&$orderby=startDateTime+asc,+eventName+asc&$select={self.select_fields}"  # noqa
+        # Ask for the total count only, so every page can be requested at once
+        yield scrapy.Request(
+            f"{url}&$count=true&$top=0",
+            callback=self.parse_count,
+            meta={"events_url": url},
+        )
+
+    def parse_count(self, response):
+        """Issue one request per `$skip` page based on the reported `@odata.count`"""
+        url = response.meta["events_url"]
+        count = json_loads(response.body).get("@odata.count")
+        if count is None:
+            # No count available, page through sequentially with nextLink
             yield scrapy.Request(url, callback=self.parse)
+            return
+        for skip in range(0, count, self.page_size):
+            yield scrapy.Request(
+                f"{url}&$top={self.page_size}&$skip={skip}",
+                callback=self.parse,
+                meta={"page_end": skip + self.page_size},
+            )
 
     def parse(self, response):
         """
@@ -53,7 +92,7 @@ class TulokBoccSpider(CityScrapersSpider):
         Change the `_parse_title`, `_parse_start`, etc methods to fit your scraping
         needs.
         """
-        data = response.json()
+        data = json_loads(response.body)
         events = data.get("value", [])
 
         for raw_event in events:
@@ -75,10 +114,39 @@ class TulokBoccSpider(CityScrapersSpider):
 
             yield meeting
 
-        # Handle pagination
+        # Handle pagination. The server may cap page sizes below `page_size`, so
+        # follow nextLink but stay within the window of the requested page
         next_link = data.get("@odata.nextLink")
         if next_link:
-            yield scrapy.Request(next_link, callback=self.parse)
+            page_end = response.meta.get("page_end")
+            if self._in_window(next_link, page_end):
+                yield response.follow(
+                    next_link,
+                    callback=self.parse,
+                    meta={"page_end": page_end},
+                    priority=response.request.priority - 1,
+                )
+
+    def _in_window(self, next_link, page_end):
+        """
+        Check if a nextLink still falls inside the page window requested by
+        `parse_count`. Sequential paging without a window follows every link.
+        """
+        if page_end is None:
+            return True
+        skip = self._get_skip(next_link)
+        if skip is None:
+            # Without `$skip` (e.g. a `$skiptoken`) there is no way to tell where
+            # the link points, and following it from every window would fetch
+            # the rest of the collection once per window
+            self.logger.warning("Not following nextLink without $skip: %s", next_link)
+            return False
+        return skip < page_end
+
+    def _get_skip(self, url):
+        """Return the `$skip` value of an OData URL, None if not present"""
+        skip = parse_qs(urlsplit(url).query).get("$skip")
+        return int(skip[0]) if skip else None
 
     def _parse_title(self, raw_event):
         """Parse or generate meeting title."""
@@ -99,20 +167,24 @@ class TulokBoccSpider(CityScrapersSpider):
         event_location = raw_event.get("eventLocation") or {}
 
         location_name = "Tulsa County Headquarters Building"
-        address_parts = [
-            event_location.get("address1") or "",
-            event_location.get("address2") or "",
-            ", ".join(
-                part
-                for part in [
-                    event_location.get("city"),
-                    event_location.get("state"),
-                    event_location.get("zipCode"),
-                ]
-                if part
-            ),
-        ]
-        address = " ".join(part for part in address_parts if part).strip()
+        city_state_zip = ", ".join(
+            part
+            for part in (
+                event_location.get("city"),
+                event_location.get("state"),
+                event_location.get("zipCode"),
+            )
+            if part
+        )
+        address = " ".join(
+            part
+            for part in (
+                event_location.get("address1"),
+                event_location.get("address2"),
+                city_state_zip,
+            )
+            if part
+        ).strip()
 
         return {
             "name": location_name,
@@ -122,15 +194,18 @@ class TulokBoccSpider(CityScrapersSpider):
     def _parse_links(self, raw_event):
         """Parse or generate links."""
         event_id = raw_event.get("id")
+        if not event_id:
+            return []
+        files_url = f"{self.portal_base_url}/event/{event_id}/files/agenda/"
         links = []
         for f in raw_event.get("publishedFiles", []):
             file_id = f.get("fileId")
-            if not file_id or not event_id:
+            if not file_id:
                 continue
             links.append(
                 {
                     "title": f.get("type") or "Document",
-                    "href": f"{self.portal_base_url}/event/{event_id}/files/agenda/{file_id}",  # noqa
+                    "href": f"{files_url}{file_id}",
                 }
             )
         return links
@@ -139,11 +214,4 @@ class TulokBoccSpider(CityScrapersSpider):
         """Parse an ISO datetime string into a naive datetime object."""
         if not dt_str:
             return None
-        # Handle ISO format like '2025-11-19T11:30:00Z'
-        dt_str = dt_str.replace("Z", "+00:00")
-        try:
-            dt = datetime.fromisoformat(dt_str)
-            # Return naive datetime (strip timezone)
-            return dt.replace(tzinfo=None)
-        except ValueError:
-            return None
+        return _parse_iso_datetime(dt_str)
@@ -1,3 +1,4 @@
+import functools
 import re
 from datetime import datetime
 
@@ -7,6 +8,20 @@ from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
 from dateutil.relativedelta import relativedelta
 
+from city_scrapers.utils import json_loads
+
+# Street address following the location name, e.g. "Room, 3027 S. New Haven Ave."
+_ADDRESS_RE = re.compile(r",\s*(\d+\s+.+)$")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_meeting_datetime(dt_str):
+    """Parse a 'YYYY-MM-DD HH:MM' string, returning None if it is invalid."""
+    try:
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        return None
+
 
 class TulokBoedSpider(CityScrapersSpider):
     name = "tulok_boed"
@@ -14,7 +29,10 @@ class TulokBoedSpider(CityScrapersSpider):
     timezone = "America/Chicago"
     start_url = "https://tulsaschools.diligent.community/Services/MeetingsService.svc/meetings?from={start_date}&to=9999-12-31"  # noqa
     agenda_url = "https://tulsaschools.diligent.community/Portal/MeetingInformation.aspx?Org=Cal&Id={}"  # noqa
-    custom_settings = {"ROBOTSTXT_OBEY": False}
+    custom_settings = {
+        "ROBOTSTXT_OBEY": False,
+        "DOWNLOAD_TIMEOUT": 60,
+    }
 
     def start_requests(self):
         """Generate initial requests with formatted start date."""
@@ -27,7 +45,7 @@ class TulokBoedSpider(CityScrapersSpider):
         Parse meeting items from the Diligent Community API.
         Returns JSON array of meeting objects with full details.
         """
-        data = response.json()
+        data = json_loads(response.body)
         for item in data:
             meeting = Meeting(
                 title=item.get("MeetingTypeName") or "Board Meeting",
@@ -53,17 +71,14 @@ class TulokBoedSpider(CityScrapersSpider):
         """
         dt_str = item.get("MeetingDateTime")
         if dt_str:
-            try:
-                return datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-            except ValueError:
-                return None
+            return _parse_meeting_datetime(dt_str)
         return None
 
     def _parse_location(self, item):
         """Parse location from MeetingLocation field."""
         location_str = item.get("MeetingLocation", "")
         # Split on street address pattern (starts with number)
-        match = re.search(r",\s*(\d+\s+.+)$", location_str)
+        match = _ADDRESS_RE.search(location_str)
         if match:
             name = location_str[: match.start()].strip()
             address = match.group(1)
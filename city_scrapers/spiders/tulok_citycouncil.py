@@ -11,6 +11,7 @@ for Tulsa City Council meetings and City Council committee meetings, including:
 URL: https://tulsa-ok.granicus.com/ViewPublisher.php?view_id=4
 """
 
+import functools
 import re
 from datetime import datetime
 from typing import Any, ClassVar
@@ -18,6 +19,84 @@ from typing import Any, ClassVar
 from city_scrapers_core.constants import CITY_COUNCIL, COMMITTEE
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
+from lxml import etree
+
+from city_scrapers.utils import (
+    GRANICUS_AGENDA_XPATH,
+    GRANICUS_DATE_XPATH,
+    GRANICUS_LIST_ITEM,
+    GRANICUS_LISTING_ROW,
+    GRANICUS_LISTING_TABLE,
+    GRANICUS_TITLE_XPATH,
+    GRANICUS_VIDEO_XPATHS,
+    MONTHS,
+    WINDOW_OPEN_RE,
+    to_24_hour,
+)
+
+# Meeting dates such as "November 19, 2025 - 5:00 PM"
+_DATE_RE = re.compile(
+    r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})\s*-\s*"
+    r"(\d{1,2}):(\d{2})\s*([AaPp])\.?\s*[Mm]\.?"
+)
+
+# Upcoming event cells use the shared Granicus row selectors; the selectors
+# below find the yearly archive panels and the upcoming table itself.
+
+# Year panels such as "CollapsiblePanel20241" (year followed by a suffix digit)
+_PANELS_XPATH = etree.XPath("//div[starts-with(@id, 'CollapsiblePanel')]")
+_PANEL_ROWS_XPATH = etree.XPath(
+    f".//{GRANICUS_LISTING_TABLE}//tbody//{GRANICUS_LISTING_ROW}"
+)
+_UPCOMING_TABLE_XPATH = etree.XPath(
+    f"//{GRANICUS_LISTING_TABLE}[contains(@summary, 'Upcoming')]"
+)
+_UPCOMING_ROWS_XPATH = etree.XPath(f".//tbody//{GRANICUS_LISTING_ROW}")
+
+# Archive rows look for links and dates in any column
+_ROW_DATE_XPATH = etree.XPath(
+    f"normalize-space(.//{GRANICUS_LIST_ITEM}[contains(@headers, 'Date')])",
+    smart_strings=False,
+)
+_ROW_AGENDA_XPATH = etree.XPath(
+    f".//{GRANICUS_LIST_ITEM}//a[contains(@href, 'AgendaViewer')]/@href",
+    smart_strings=False,
+)
+_ROW_VIDEO_XPATH = etree.XPath(
+    f".//{GRANICUS_LIST_ITEM}//a[contains(@onclick, 'MediaPlayer')]/@onclick",
+    smart_strings=False,
+)
+_IN_PROGRESS_XPATH = etree.XPath(
+    f".//{GRANICUS_LIST_ITEM}[@headers='Date']"
+    "//a[contains(@onclick, 'MediaPlayer')]/text()",
+    smart_strings=False,
+)
+
+_PANEL_ID_RE = re.compile(r"CollapsiblePanel(\d{4})([1-4])$")
+
+_COMMITTEE_RE = re.compile(r"\bcommittee\b", re.IGNORECASE)
+_COUNCIL_RE = re.compile(r"\bCouncil\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_datetime(date_text):
+    """
+    Build a datetime from date cell text, or return None when the text
+    does not match. Raises ValueError for out-of-range values.
+    """
+    match = _DATE_RE.search(date_text)
+    month = MONTHS.get(match.group(1).lower()) if match else None
+    if not month:
+        return None
+
+    _, day, year, hour, minute, ampm_letter = match.groups()
+    hour = int(hour)
+    if not 1 <= hour <= 12:
+        raise ValueError(f"Invalid 12-hour clock hour: {hour}")
+
+    return datetime(
+        int(year), month, int(day), to_24_hour(hour, ampm_letter), int(minute)
+    )
 
 
 class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
@@ -35,6 +114,7 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
     # Override robots.txt - this is public meeting data
     custom_settings: ClassVar[dict[str, Any]] = {
         "ROBOTSTXT_OBEY": False,
+        "DOWNLOAD_TIMEOUT": 60,
     }
 
     def parse(self, response):
@@ -48,32 +128,29 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         CollapsiblePanel2023X, etc. where X is a digit suffix
         (1=City Council, 2-4=committees).
         """
-        # Define panel IDs for each year (2016 through next year)
-        # Panel suffixes: 1=City Council, 2-4=Committees
-        # We process all panel suffixes 1-4 to capture both
-        # City Council and committee meetings
-        year_panel_configs = [
-            (year, suffix, f"CollapsiblePanel{year}{suffix}")
-            for year in range(2016, datetime.now().year + 2)
-            for suffix in range(1, 5)  # Suffixes 1-4
-        ]
+        # Select every candidate panel in a single pass, then keep years 2016
+        # through next year with suffixes 1-4 (1=City Council, 2-4=Committees)
+        max_year = datetime.now().year + 1
+        year_panels = []
+        for panel in _PANELS_XPATH(response.selector.root):
+            match = _PANEL_ID_RE.match(panel.get("id"))
+            if match and 2016 <= int(match.group(1)) <= max_year:
+                year_panels.append((int(match.group(1)), int(match.group(2)), panel))
+
+        # Keep the year then suffix ordering regardless of document order
+        year_panels.sort(key=lambda year_panel: year_panel[:2])
 
         # Iterate through each panel
-        for year, suffix, panel_id in year_panel_configs:
-            panel = response.css(f"div#{panel_id}")
-
-            if not panel:
-                continue
-
+        for year, suffix, panel in year_panels:
             # Extract all meeting rows from the table
-            meeting_rows = panel.css("table.listingTable tbody tr.listingRow")
+            meeting_rows = _PANEL_ROWS_XPATH(panel)
 
             if meeting_rows:
                 panel_type = (
                     "City Council" if suffix == 1 else f"Committee (suffix {suffix})"
                 )
                 self.logger.info(
-                    f"Found {len(meeting_rows)} {panel_type} meetings for {year}"
+                    "Found %d %s meetings for %d", len(meeting_rows), panel_type, year
                 )
 
                 for row in meeting_rows:
@@ -91,58 +168,51 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         Parse a single meeting row from the table.
 
         Args:
-            row: Scrapy selector for a table row
+            row: lxml element for a table row
             response: Scrapy response object
 
         Returns:
             Meeting item or None
         """
-        try:
-            # Extract meeting title
-            title = row.css('td.listItem[headers="Name"]::text').get()
-            if title:
-                title = title.strip()
-            else:
-                title = "City Council Meeting"
+        # Extract meeting title
+        titles = GRANICUS_TITLE_XPATH(row)
+        if titles:
+            title = titles[0].strip()
+        else:
+            title = "City Council Meeting"
 
-            # Extract date and time
-            date_text = (
-                row.css('td.listItem[headers*="Date"]').xpath("normalize-space()").get()
-            )
+        # Extract date and time
+        date_text = _ROW_DATE_XPATH(row)
 
-            start = self._parse_datetime(date_text)
-            if not start:
-                self.logger.warning(f"Could not parse date from: {date_text}")
-                return None
+        start = self._parse_datetime(date_text)
+        if not start:
+            self.logger.warning("Could not parse date from: %s", date_text)
+            return None
 
-            # Extract links (Agenda and Video)
-            links = self._parse_links(row, response)
-
-            # Determine classification based on title
-            classification = self._get_classification(title)
-
-            # Build meeting item
-            meeting = Meeting(
-                title=title,
-                description="",
-                classification=classification,
-                start=start,
-                end=None,
-                all_day=False,
-                time_notes="",
-                location=self.location,
-                links=links,
-                source=response.url,
-            )
+        # Extract links (Agenda and Video)
+        links = self._parse_links(row, response)
 
-            meeting["status"] = self._get_status(meeting)
-            meeting["id"] = self._get_id(meeting)
+        # Determine classification based on title
+        classification = self._get_classification(title)
 
-        except Exception:
-            self.logger.exception("Error parsing meeting row")
-            return None
-        else:
-            return meeting
+        # Build meeting item
+        meeting = Meeting(
+            title=title,
+            description="",
+            classification=classification,
+            start=start,
+            end=None,
+            all_day=False,
+            time_notes="",
+            location=self.location,
+            links=links,
+            source=response.url,
+        )
+
+        meeting["status"] = self._get_status(meeting)
+        meeting["id"] = self._get_id(meeting)
+
+        return meeting
 
     def _get_classification(self, title):
         """
@@ -154,7 +224,7 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         Returns:
             Classification constant (COMMITTEE or CITY_COUNCIL)
         """
-        if re.search(r"\bcommittee\b", title, re.IGNORECASE):
+        if _COMMITTEE_RE.search(title):
             return COMMITTEE
         return CITY_COUNCIL
 
@@ -178,24 +248,14 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         try:
             # Parse format: "Month Day, Year - HH:MM AM/PM"
             # Example: "November 19, 2025 - 5:00 PM"
-            pattern = (
-                r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})\s*-\s*"
-                r"(\d{1,2}):(\d{2})\s*([AaPp])\.?\s*[Mm]\.?"
-            )
-            match = re.search(pattern, date_text)
+            dt = _match_datetime(date_text)
 
-            if match:
-                month_name, day, year, hour, minute, ampm_letter = match.groups()
-                ampm = f"{ampm_letter.upper()}M"
-
-                # Build datetime string
-                datetime_str = f"{month_name} {day}, {year} {hour}:{minute} {ampm}"
-
-                # Parse the datetime
-                dt = datetime.strptime(datetime_str, "%B %d, %Y %I:%M %p")
+            if dt:
                 return dt
             else:
-                self.logger.warning(f"Could not match datetime pattern in: {date_text}")
+                self.logger.warning(
+                    "Could not match datetime pattern in: %s", date_text
+                )
                 return None
 
         except Exception:
@@ -207,7 +267,7 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         Extract agenda and video links from the meeting row.
 
         Args:
-            row: Scrapy selector for a table row
+            row: lxml element for a table row
             response: Scrapy response object for URL joining
 
         Returns:
@@ -216,17 +276,15 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         links = []
 
         # Extract Agenda link
-        agenda_link = row.css('td.listItem a[href*="AgendaViewer"]::attr(href)').get()
-        if agenda_link:
-            links.append({"href": response.urljoin(agenda_link), "title": "Agenda"})
+        agenda_links = _ROW_AGENDA_XPATH(row)
+        if agenda_links:
+            links.append({"href": response.urljoin(agenda_links[0]), "title": "Agenda"})
 
         # Extract Video link from onclick attribute
-        video_onclick = row.css(
-            'td.listItem a[onclick*="MediaPlayer"]::attr(onclick)'
-        ).get()
-        if video_onclick:
+        video_onclicks = _ROW_VIDEO_XPATH(row)
+        if video_onclicks and "window.open" in video_onclicks[0]:
             # Extract URL from window.open JS call
-            match = re.search(r'window\.open\(\s*[\'"]([^\'"]+)[\'"]', video_onclick)
+            match = WINDOW_OPEN_RE.search(video_onclicks[0])
             if match:
                 video_link = match.group(1)
                 links.append({"href": response.urljoin(video_link), "title": "Video"})
@@ -246,43 +304,37 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         meetings = []
 
         # Find the upcoming events table (summary attribute identifies it)
-        upcoming_table = response.css('table.listingTable[summary*="Upcoming"]')
+        upcoming_table = _UPCOMING_TABLE_XPATH(response.selector.root)
 
         if not upcoming_table:
             self.logger.info("Could not find upcoming events table")
             return meetings
 
         # Extract all meeting rows from the upcoming events table
-        meeting_rows = upcoming_table.css("tbody tr.listingRow")
+        meeting_rows = [
+            row for table in upcoming_table for row in _UPCOMING_ROWS_XPATH(table)
+        ]
 
         meeting_count = 0
         for row in meeting_rows:
             # Extract meeting title to filter for City Council and committee meetings
-            title = row.css('td.listItem[headers="Name"]::text').get()
-            if not title:
+            titles = GRANICUS_TITLE_XPATH(row)
+            if not titles:
                 continue
 
-            title = title.strip()
+            title = titles[0].strip()
 
             # Only process City Council and City Council committee meetings
             # Filter out other bodies like Human Rights Commission,
-            # Planning Commission, etc.
-            # First check for committees, then any other meeting with
-            # "Council" is a City Council meeting
-            is_committee = re.search(
-                r"\bCouncil\b.*\bCommittee\b", title, re.IGNORECASE
-            )
-            is_city_council = (
-                re.search(r"\bCouncil\b", title, re.IGNORECASE) and not is_committee
-            )
-
-            if is_city_council or is_committee:
+            # Planning Commission, etc. Both council meetings and council
+            # committees have "Council" in their titles
+            if _COUNCIL_RE.search(title):
                 meeting = self._parse_upcoming_event_row(row, response)
                 if meeting:
                     meetings.append(meeting)
                     meeting_count += 1
 
-        self.logger.info(f"Found {meeting_count} upcoming meetings")
+        self.logger.info("Found %d upcoming meetings", meeting_count)
         return meetings
 
     def _parse_upcoming_event_row(self, row, response):
@@ -290,84 +342,75 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         Parse a single upcoming event row from the table.
 
         Args:
-            row: Scrapy selector for a table row
+            row: lxml element for a table row
             response: Scrapy response object
 
         Returns:
             Meeting item or None
         """
-        try:
-            # Extract meeting title
-            title = row.css('td.listItem[headers="Name"]::text').get()
-            if title:
-                title = title.strip()
-            else:
-                title = "City Council Meeting"
-
-            # Extract date and time from the Date column. This can contain
-            # either plain text date or "In Progress" with embedded link
-            date_cell = row.css('td.listItem[headers="Date"]')
-
-            # Get normalized text (automatically handles whitespace)
-            date_text = date_cell.xpath("normalize-space()").get()
-
-            # Skip "In Progress" text for date parsing
-            if date_text:
-                date_text = date_text.replace("In Progress", "").strip()
-
-            # If no date found, check if this is an "In Progress" meeting.
-            # For "In Progress" meetings, skip them as they don't have a date
-            if not date_text:
-                # Check if the date cell contains "In Progress" link
-                in_progress_link = date_cell.css(
-                    'a[onclick*="MediaPlayer"]::text'
-                ).get()
-                if in_progress_link and "In Progress" in in_progress_link:
-                    self.logger.info(f"Skipping 'In Progress' meeting: {title}")
-                    return None
-
-            start = self._parse_datetime(date_text)
-            if not start:
-                self.logger.warning(
-                    f"Could not parse date from upcoming event: {date_text}"
-                )
+        # Extract meeting title
+        titles = GRANICUS_TITLE_XPATH(row)
+        if titles:
+            title = titles[0].strip()
+        else:
+            title = "City Council Meeting"
+
+        # Extract date and time from the Date column. This can contain
+        # either plain text date or "In Progress" with embedded link
+        # Get normalized text (automatically handles whitespace)
+        date_text = GRANICUS_DATE_XPATH(row)
+
+        # Skip "In Progress" text for date parsing
+        if date_text:
+            date_text = date_text.replace("In Progress", "").strip()
+
+        # If no date found, check if this is an "In Progress" meeting.
+        # For "In Progress" meetings, skip them as they don't have a date
+        if not date_text:
+            # Check if the date cell contains "In Progress" link
+            in_progress_links = _IN_PROGRESS_XPATH(row)
+            if in_progress_links and "In Progress" in in_progress_links[0]:
+                self.logger.info("Skipping 'In Progress' meeting: %s", title)
                 return None
 
-            # Extract links (Agenda and Video)
-            links = self._parse_upcoming_event_links(row, response)
-
-            # Determine classification based on title
-            classification = self._get_classification(title)
-
-            # Build meeting item
-            meeting = Meeting(
-                title=title,
-                description="",
-                classification=classification,
-                start=start,
-                end=None,
-                all_day=False,
-                time_notes="",
-                location=self.location,
-                links=links,
-                source=response.url,
+        start = self._parse_datetime(date_text)
+        if not start:
+            self.logger.warning(
+                "Could not parse date from upcoming event: %s", date_text
             )
+            return None
 
-            meeting["status"] = self._get_status(meeting)
-            meeting["id"] = self._get_id(meeting)
+        # Extract links (Agenda and Video)
+        links = self._parse_upcoming_event_links(row, response)
 
-        except Exception:
-            self.logger.exception("Error parsing upcoming event row")
-            return None
-        else:
-            return meeting
+        # Determine classification based on title
+        classification = self._get_classification(title)
+
+        # Build meeting item
+        meeting = Meeting(
+            title=title,
+            description="",
+            classification=classification,
+            start=start,
+            end=None,
+            all_day=False,
+            time_notes="",
+            location=self.location,
+            links=links,
+            source=response.url,
+        )
+
+        meeting["status"] = self._get_status(meeting)
+        meeting["id"] = self._get_id(meeting)
+
+        return meeting
 
     def _parse_upcoming_event_links(self, row, response):
         """
         Extract agenda and video links from an upcoming event row.
 
         Args:
-            row: Scrapy selector for a table row
+            row: lxml element for a table row
             response: Scrapy response object for URL joining
 
         Returns:
@@ -376,31 +419,25 @@ class TulsaGranicusCityCouncilSpider(CityScrapersSpider):
         links = []
 
         # Extract Agenda link (uses event_id instead of clip_id)
-        agenda_link = row.css(
-            'td.listItem[headers="AgendaLink"] a[href*="AgendaViewer"]::attr(href)'
-        ).get()
-        if agenda_link:
-            links.append({"href": response.urljoin(agenda_link), "title": "Agenda"})
+        agenda_links = GRANICUS_AGENDA_XPATH(row)
+        if agenda_links:
+            links.append({"href": response.urljoin(agenda_links[0]), "title": "Agenda"})
 
         # Extract Video/Live link from either:
         # 1. ViewEventLink column (for live/in-progress meetings)
         # 2. Date column (for in-progress meetings with embedded link)
 
-        # Check ViewEventLink column
-        video_onclick = row.css(
-            'td.listItem[headers="ViewEventLink"] '
-            'a[onclick*="MediaPlayer"]::attr(onclick)'
-        ).get()
-
-        # If not found, check Date column for in-progress meetings
-        if not video_onclick:
-            video_onclick = row.css(
-                'td.listItem[headers="Date"] a[onclick*="MediaPlayer"]::attr(onclick)'
-            ).get()
+        # Check ViewEventLink column first, then the Date column
+        video_onclick = None
+        for video_xpath in GRANICUS_VIDEO_XPATHS:
+            onclicks = video_xpath(row)
+            if onclicks:
+                video_onclick = onclicks[0]
+                break
 
-        if video_onclick:
+        if video_onclick and "window.open" in video_onclick:
             # Extract URL from window.open JS call
-            match = re.search(r'window\.open\(\s*[\'"]([^\'"]+)[\'"]', video_onclick)
+            match = WINDOW_OPEN_RE.search(video_onclick)
             if match:
                 video_link = match.group(1)
                 links.append({"href": response.urljoin(video_link), "title": "Video"})
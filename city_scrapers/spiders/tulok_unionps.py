@@ -1,10 +1,85 @@
 import re
 from datetime import datetime
+from urllib.parse import urljoin
 
 import scrapy
 from city_scrapers_core.constants import BOARD
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
+from lxml import etree
+from scrapy.utils.response import get_base_url
+
+from city_scrapers.utils import MONTHS, has_class
+
+# Per-link anchors: a link's text, the text after it, and the links beside it
+_STRING_XPATH = etree.XPath("string()", smart_strings=False)
+_NEXT_TEXT_XPATH = etree.XPath("following-sibling::text()[1]", smart_strings=False)
+_SIBLING_LINKS_XPATH = etree.XPath("following-sibling::a")
+
+
+# Board of education page description paragraph
+_DESCRIPTION_XPATH = etree.XPath("(//*[@id='fsEl_21196']//p)[1]")
+
+# Agendas and minutes page sections
+_TIME_NOTES_XPATH = etree.XPath("//*[@id='fsEl_23341']//p/text()", smart_strings=False)
+# Past agenda links, matching "agenda" in the file name case-insensitively
+_PAST_AGENDA_LINKS_XPATH = etree.XPath(
+    f"//*[@id='fsEl_23352']//section[{has_class('fsPanel')}]"
+    "//a[contains(translate(@data-file-name, 'AGEND', 'agend'), 'agenda')]"
+)
+_UPCOMING_TEXT_XPATH = etree.XPath(
+    f"//section[@id='fsEl_23350']//div[{has_class('fsStyleColumn')}]//p/text()",
+    smart_strings=False,
+)
+
+# Meeting dates such as "March 13, 2025", allowing OCR typos in the day
+_DATE_RE = re.compile(
+    # Alternation order only affects speed, later months are tried first
+    r"(October|November|December|September|August|July|June|May|April|March|February|January)"  # noqa
+    r"\s+([0-9lI]{1,2})(?:,?\s+)(\d{4})",
+    flags=re.IGNORECASE,
+)
+
+# Board report video, checked in priority order. A single union expression would
+# return matches in document order instead, so these stay separate
+_VIDEO_SECTION = "//h3[contains(text(), 'Video')]/following-sibling::p"
+_VIDEO_IFRAME_XPATH = etree.XPath(
+    f"{_VIDEO_SECTION}//iframe[contains(@src, 'youtube.com')]/@src",
+    smart_strings=False,
+)
+_VIDEO_LINK_XPATH = etree.XPath(
+    f"{_VIDEO_SECTION}//a[contains(@href, 'youtube.com/watch')]/@href",
+    smart_strings=False,
+)
+_LAST_IFRAME_XPATH = etree.XPath(
+    "//iframe[contains(@src, 'youtube.com')][not(following-sibling::iframe)]/@src",
+    smart_strings=False,
+)
+
+# Video id in a YouTube embed URL
+_YOUTUBE_EMBED_RE = re.compile(r"youtube\.com/embed/([a-zA-Z0-9_-]+)")
+
+# Common OCR typos in day numbers, e.g. "l3" or "I3" for "13"
+_DAY_TYPOS = str.maketrans("lI", "11")
+
+
+def _text_before_br(element):
+    """
+    Text content of an lxml element up to its first <br>, which may be nested
+    in a child element. Returns the text and whether a <br> was found.
+    """
+    parts = [element.text or ""]
+    for child in element:
+        if child.tag == "br":
+            return "".join(parts), True
+        # Skip the content of comments and processing instructions
+        if isinstance(child.tag, str):
+            text, found_br = _text_before_br(child)
+            parts.append(text)
+            if found_br:
+                return "".join(parts), True
+        parts.append(child.tail or "")
+    return "".join(parts), False
 
 
 class TulokUnionpsSpider(CityScrapersSpider):
@@ -20,14 +95,6 @@ class TulokUnionpsSpider(CityScrapersSpider):
         "address": "8506 E 61st St, Tulsa, OK 74133",
     }
 
-    date_re = re.compile(
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)"  # noqa
-        r"\s+([0-9lI]{1,2})(?:,?\s+)(\d{4})",
-        flags=re.IGNORECASE,
-    )
-
-    YOUTUBE_EMBED_RE = re.compile(r"youtube\.com/embed/([a-zA-Z0-9_-]+)")
-
     def parse(self, response):
         """Start by fetching board page."""
         yield response.follow(
@@ -40,39 +107,45 @@ class TulokUnionpsSpider(CityScrapersSpider):
         """Parse description and prepare meetings."""
         main_page = response.meta["main_page"]
 
-        p_html = response.css("#fsEl_21196 p").get()
-        desc = p_html.split("<br")[0]
-        desc = scrapy.Selector(text=desc).xpath("string()").get().strip()
+        # Only the text before the first line break is the description
+        desc, _ = _text_before_br(_DESCRIPTION_XPATH(response.selector.root)[0])
+        desc = desc.strip()
 
         time_notes = (
             " ".join(
                 t.strip().replace("\xa0", " ")
-                for t in main_page.css("#fsEl_23341 p::text").getall()
+                for t in _TIME_NOTES_XPATH(main_page.selector.root)
                 if t.strip()
             )
             or "Regular meetings typically begin at 7:00 PM"
         )
 
+        seen_texts = set()
         seen_dates = set()
         sources = self._collect_sources(main_page)
 
         # Process each meeting
-        for entry in sources:
-            start_dt = self._parse_start_from_text(entry["text"])
-            if not start_dt or start_dt.date() in seen_dates:
+        for text, anchor in sources:
+            # Repeated text always parses to an already seen (or missing) date
+            if text in seen_texts:
                 continue
-            seen_dates.add(start_dt.date())
+            seen_texts.add(text)
+
+            start_dt = self._parse_start_from_text(text)
+            if not start_dt:
+                continue
+            # Dates are tracked by ordinal day number, an int hashes cheaper
+            day = start_dt.toordinal()
+            if day in seen_dates:
+                continue
+            seen_dates.add(day)
 
             title = (
-                self._parse_title(entry["anchor"])
-                if entry["anchor"]
+                self._parse_title(anchor)
+                if anchor is not None
                 else "Board of Education Meeting"
             )
-            links = (
-                self._collect_links(main_page, entry["anchor"])
-                if entry["anchor"]
-                else []
-            )
+            links = self._collect_links(main_page, anchor) if anchor is not None else []
 
             # If Board Report exists, fetch in parallel
             board_report_link = next(
@@ -102,26 +175,21 @@ class TulokUnionpsSpider(CityScrapersSpider):
                 )
 
     def _collect_sources(self, main_page):
-        """Collect past and upcoming meeting sources."""
-        sources = []
+        """Collect past and upcoming meeting sources as (text, anchor) pairs."""
         # Past meetings
-        for link in main_page.css("#fsEl_23352 section.fsPanel a"):
-            file_name = (link.attrib.get("data-file-name") or "").lower()
-            if "agenda" in file_name:
-                sources.append(
-                    {
-                        "text": (link.xpath("string()").get() or "").strip(),
-                        "anchor": link,
-                    }
-                )
+        sources = [
+            (_STRING_XPATH(link).strip(), link)
+            for link in _PAST_AGENDA_LINKS_XPATH(main_page.selector.root)
+        ]
 
-        # Upcoming meetings
-        for text in main_page.css(
-            "section#fsEl_23350 div.fsStyleColumn p::text"
-        ).getall():
-            for line in text.split("\n"):
-                if stripped := line.strip():
-                    sources.append({"text": stripped, "anchor": None})
+        # Upcoming meetings, one per line. Only the first date on a line is the
+        # meeting, e.g. "March 16, 2026 (moved from March 9, 2026)"
+        upcoming_text = "\n".join(_UPCOMING_TEXT_XPATH(main_page.selector.root))
+        search_date = _DATE_RE.search
+        for line in upcoming_text.splitlines():
+            match = search_date(line)
+            if match:
+                sources.append((match.group(0), None))
         return sources
 
     def parse_board_report(self, response):
@@ -145,28 +213,24 @@ class TulokUnionpsSpider(CityScrapersSpider):
     def _extract_youtube_link(self, response):
         """Extract YouTube link from the 'Video' section specifically."""
 
+        root = response.selector.root
+
         # Look for h3 with text "Video" and find iframe in following content
-        video_section = response.xpath(
-            '//h3[contains(text(), "Video")]/following-sibling::p//iframe[contains(@src, "youtube.com")]/@src'  # noqa
-        ).get()
-        if video_section:
-            match = self.YOUTUBE_EMBED_RE.search(video_section)
+        iframe_srcs = _VIDEO_IFRAME_XPATH(root)
+        if iframe_srcs:
+            match = _YOUTUBE_EMBED_RE.search(iframe_srcs[0])
             if match:
                 return f"https://www.youtube.com/watch?v={match.group(1)}"
 
         # Look for heading with "Video" and find YouTube link in following paragraph
-        video_link = response.xpath(
-            '//h3[contains(text(), "Video")]/following-sibling::p//a[contains(@href, "youtube.com/watch")]/@href'  # noqa
-        ).get()
-        if video_link:
-            return video_link
+        video_links = _VIDEO_LINK_XPATH(root)
+        if video_links:
+            return video_links[0]
 
         # Fallback - look for last iframe (Video section is usually last)
-        iframe_src = response.css(
-            'iframe[src*="youtube.com"]:last-of-type::attr(src)'
-        ).get()
-        if iframe_src:
-            match = self.YOUTUBE_EMBED_RE.search(iframe_src)
+        iframe_srcs = _LAST_IFRAME_XPATH(root)
+        if iframe_srcs:
+            match = _YOUTUBE_EMBED_RE.search(iframe_srcs[0])
             if match:
                 return f"https://www.youtube.com/watch?v={match.group(1)}"
 
@@ -204,45 +268,56 @@ class TulokUnionpsSpider(CityScrapersSpider):
         return meeting
 
     def _parse_title(self, anchor):
-        search_texts = [
-            (anchor.attrib.get("data-file-name") or "").lower(),
-            (anchor.xpath("string()").get() or "").lower(),
-            (anchor.xpath("following-sibling::text()[1]").get() or "").lower(),
-        ]
+        next_texts = _NEXT_TEXT_XPATH(anchor)
+        # The separator keeps a match from spanning two of the joined texts
+        search_text = "|".join(
+            (
+                anchor.get("data-file-name") or "",
+                _STRING_XPATH(anchor),
+                next_texts[0] if next_texts else "",
+            )
+        ).lower()
         return (
             "Board of Education Special Meeting"
-            if any("special" in t for t in search_texts)
+            if "special" in search_text
             else "Board of Education Meeting"
         )
 
     def _parse_start_from_text(self, text):
         """Parse a date from text, fixing common OCR typos."""
-        m = self.date_re.search(text)
+        m = _DATE_RE.search(text)
         if not m:
             return None
-        month = m.group(1)
-        day = int(m.group(2).replace("l", "1").replace("I", "1"))
+        month = MONTHS[m.group(1).lower()]
+        day = int(m.group(2).translate(_DAY_TYPOS))
         year = int(m.group(3))
-        return datetime.strptime(f"{month} {day}, {year}", "%B %d, %Y").replace(
-            hour=19, minute=0
-        )
+        return datetime(year, month, day, 19, 0)
 
     def _collect_links(self, response, agenda_anchor):
+        # Same base URL response.urljoin would use, resolved once for all links
+        base_url = get_base_url(response)
         links = [
             {
-                "href": response.urljoin(agenda_anchor.attrib.get("href") or ""),
+                "href": urljoin(base_url, agenda_anchor.get("href") or ""),
                 "title": "Agenda",
             }
         ]
-        for link in agenda_anchor.xpath("following-sibling::a"):
-            text = (link.xpath("string()").get() or "").strip()
-            if self.date_re.search(text):
+        search_date = _DATE_RE.search
+        for link in _SIBLING_LINKS_XPATH(agenda_anchor):
+            text = _STRING_XPATH(link).strip()
+            # Link labels like "Minutes" have no year, only scan text that could
+            # start the next meeting's date
+            if "20" in text and search_date(text):
                 break
-            href = response.urljoin(link.attrib.get("href") or "")
             text_lower = text.lower()
-            title_lower = (link.attrib.get("title") or "").lower()
+            title_lower = (link.get("title") or "").lower()
             if "minutes" in text_lower or "minutes" in title_lower:
-                links.append({"href": href, "title": "Minutes"})
+                link_title = "Minutes"
             elif "board report" in text_lower or "board report" in title_lower:
-                links.append({"href": href, "title": "Board Report"})
+                link_title = "Board Report"
+            else:
+                continue
+            links.append(
+                {"href": urljoin(base_url, link.get("href") or ""), "title": link_title}
+            )
         return links
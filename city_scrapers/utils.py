@@ -0,0 +1,85 @@
+"""
+Helpers shared by the spiders and mixins in this project.
+"""
+
+import re
+
+from lxml import etree
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is CPython-only, fall back to json on PyPy
+    from json import loads as json_loads
+
+__all__ = [
+    "json_loads",
+    "has_class",
+    "MONTHS",
+    "to_24_hour",
+    "WINDOW_OPEN_RE",
+    "GRANICUS_LIST_ITEM",
+    "GRANICUS_LISTING_TABLE",
+    "GRANICUS_LISTING_ROW",
+    "GRANICUS_TITLE_XPATH",
+    "GRANICUS_DATE_XPATH",
+    "GRANICUS_AGENDA_XPATH",
+    "GRANICUS_VIDEO_XPATHS",
+]
+
+MONTHS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+
+def to_24_hour(hour, meridiem):
+    """Convert a 12-hour clock hour and its A/P marker to 0-23."""
+    return int(hour) % 12 + (12 if meridiem in "Pp" else 0)
+
+
+# URL opened by an onclick="window.open('...')" handler, e.g. a Granicus video
+WINDOW_OPEN_RE = re.compile(r'window\.open\(\s*[\'"]([^\'"]+)[\'"]')
+
+
+def has_class(name):
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Granicus listing tables, shared by the City Council spider and the Tulsa City
+# mixin. Row selectors are compiled once and evaluated against lxml elements.
+GRANICUS_LIST_ITEM = f"td[{has_class('listItem')}]"
+GRANICUS_LISTING_TABLE = f"table[{has_class('listingTable')}]"
+GRANICUS_LISTING_ROW = f"tr[{has_class('listingRow')}]"
+
+GRANICUS_TITLE_XPATH = etree.XPath(
+    f".//{GRANICUS_LIST_ITEM}[@headers='Name']/text()", smart_strings=False
+)
+GRANICUS_DATE_XPATH = etree.XPath(
+    f"normalize-space(.//{GRANICUS_LIST_ITEM}[@headers='Date'])", smart_strings=False
+)
+GRANICUS_AGENDA_XPATH = etree.XPath(
+    f".//{GRANICUS_LIST_ITEM}[@headers='AgendaLink']"
+    "//a[contains(@href, 'AgendaViewer')]/@href",
+    smart_strings=False,
+)
+# Upcoming events link their video from the event column, or from the date
+# column while the meeting is in progress
+GRANICUS_VIDEO_XPATHS = tuple(
+    etree.XPath(
+        f".//{GRANICUS_LIST_ITEM}[@headers='{headers}']"
+        "//a[contains(@onclick, 'MediaPlayer')]/@onclick",
+        smart_strings=False,
+    )
+    for headers in ("ViewEventLink", "Date")
+)
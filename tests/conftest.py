@@ -0,0 +1,30 @@
+from os.path import dirname, join
+
+import pytest
+from city_scrapers_core.utils import file_response
+
+FILES_DIR = join(dirname(__file__), "files")
+
+GRANICUS_URL = "https://tulsa-ok.granicus.com/ViewPublisher.php?view_id=4"
+
+TULSA_API_URL = "https://www.cityoftulsa.org/umbraco/surface/AgendasByBoard/GetAgendasByBoard/"  # noqa
+
+
+@pytest.fixture(scope="session")
+def upcoming_meetings_response():
+    """Granicus upcoming meetings page shared by the Tulsa City spider tests."""
+    return file_response(
+        join(FILES_DIR, "tulsa_city_upcoming_meetings.html"), url=GRANICUS_URL
+    )
+
+
+@pytest.fixture(scope="session")
+def asian_affairs_api_response():
+    return file_response(join(FILES_DIR, "tulok_asian_affairs.json"), url=TULSA_API_URL)
+
+
+@pytest.fixture(scope="session")
+def audit_committee_api_response():
+    return file_response(
+        join(FILES_DIR, "tulok_audit_committee.json"), url=TULSA_API_URL
+    )
@@ -1,40 +1,27 @@
-import json
 from datetime import datetime
-from os.path import dirname, join
 
 import pytest
 from city_scrapers_core.constants import COMMISSION, PASSED
-from city_scrapers_core.utils import file_response
 from freezegun import freeze_time
-from scrapy import Request
 
 from city_scrapers.spiders import tulsa_city
 
 TulokAsianAffairsSpider = tulsa_city.TulokAsianAffairsSpider
 
-test_response = file_response(
-    join(dirname(__file__), "files", "tulsa_city_upcoming_meetings.html"),
-    url="https://tulsa-ok.granicus.com/ViewPublisher.php?view_id=4",
-)
 
-with open(join(dirname(__file__), "files", "tulok_asian_affairs.json")) as f:
-    api_data = json.load(f)
-
-test_response.request = Request(
-    url=test_response.url,
-    meta={"api_data": api_data},
-)
-
-
-@pytest.fixture
-def parsed_items():
+@pytest.fixture(scope="module")
+def parsed_items(asian_affairs_api_response, upcoming_meetings_response):
     spider = TulokAsianAffairsSpider()
     with freeze_time("2026-01-09"):
-        return [item for item in spider.parse(test_response)]
+        # Meetings are only yielded once both responses have been received
+        return [
+            *spider.parse_api(asian_affairs_api_response),
+            *spider.parse_upcoming(upcoming_meetings_response),
+        ]
 
 
 def test_count(parsed_items):
-    assert len(parsed_items) == 34
+    assert len(parsed_items) == 31
 
 
 def test_title(parsed_items):
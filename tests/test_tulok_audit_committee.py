@@ -1,44 +1,34 @@
-import json
 from datetime import datetime
-from os.path import dirname, join
 
 import pytest
-from city_scrapers_core.constants import COMMITTEE, PASSED
-from city_scrapers_core.utils import file_response
+from city_scrapers_core.constants import CANCELLED, COMMITTEE
 from freezegun import freeze_time
-from scrapy import Request
 
 from city_scrapers.spiders import tulsa_city
 
 TulokAuditCommitteeSpider = tulsa_city.TulokAuditCommitteeSpider
 
-test_response = file_response(
-    join(dirname(__file__), "files", "tulsa_city_upcoming_meetings.html"),
-    url="https://tulsa-ok.granicus.com/ViewPublisher.php?view_id=4",
-)
 
-with open(join(dirname(__file__), "files", "tulok_audit_committee.json")) as f:
-    api_data = json.load(f)
-
-test_response.request = Request(
-    url=test_response.url,
-    meta={"api_data": api_data},
-)
-
-
-@pytest.fixture
-def parsed_items():
+@pytest.fixture(scope="module")
+def parsed_items(audit_committee_api_response, upcoming_meetings_response):
     spider = TulokAuditCommitteeSpider()
     with freeze_time("2026-01-09"):
-        return [item for item in spider.parse(test_response)]
+        # Meetings are only yielded once both responses have been received
+        return [
+            *spider.parse_api(audit_committee_api_response),
+            *spider.parse_upcoming(upcoming_meetings_response),
+        ]
 
 
 def test_count(parsed_items):
-    assert len(parsed_items) == 152
+    assert len(parsed_items) == 132
 
 
 def test_title(parsed_items):
-    assert parsed_items[0]["title"] == "Audit Committee of the City of Tulsa (AUDIT)"
+    assert (
+        parsed_items[0]["title"]
+        == "Audit Committee of the City of Tulsa (AUDIT) - Canceled"
+    )
 
 
 def test_description(parsed_items):
@@ -69,7 +59,8 @@ def test_id(parsed_items):
 
 
 def test_status(parsed_items):
-    assert parsed_items[0]["status"] == PASSED
+    # The API lists this meeting twice, the later record cancels it
+    assert parsed_items[0]["status"] == CANCELLED
 
 
 def test_location(parsed_items):
@@ -90,7 +81,7 @@ def test_links(parsed_items):
     assert len(parsed_items[0]["links"]) == 1
     assert parsed_items[0]["links"] == [
         {
-            "href": "https://www.cityoftulsa.org/apps/COTDisplayDocument/?DocumentType=Agenda&DocumentIdentifiers=31465",  # noqa
+            "href": "https://www.cityoftulsa.org/apps/COTDisplayDocument/?DocumentType=Agenda&DocumentIdentifiers=31483",  # noqa
             "title": "Agenda",
         },
     ]
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from os.path import dirname, join
 
@@ -5,36 +6,55 @@ import pytest
 from city_scrapers_core.constants import BOARD
 from city_scrapers_core.utils import file_response
 from freezegun import freeze_time
+from scrapy import Request
+from scrapy.http import TextResponse
 
 from city_scrapers.spiders.tulok_bocc import TulokBoccSpider
 
+FILES_DIR = join(dirname(__file__), "files")
+
+EVENTS_URL = "https://tulsacook.api.civicclerk.com/v1/Events?$filter=categoryId+in+(26,40)"  # noqa
+
 # Load local JSON file for testing
 test_response = file_response(
-    join(dirname(__file__), "files", "tulok_bocc.json"),
-    url="https://tulsacook.api.civicclerk.com/v1/Events?$filter=categoryId+in+(26,40)",
+    join(FILES_DIR, "tulok_bocc.json"),
+    url=EVENTS_URL,
 )
 
 # Load HTML file for testing info page parsing
 info_page_response = file_response(
-    join(dirname(__file__), "files", "tulok_bocc.html"),
+    join(FILES_DIR, "tulok_bocc.html"),
     url="https://www2.tulsacounty.org/Legacy/agendasdetail_civic.aspx?entity=BOCC",
 )
 
-spider = TulokBoccSpider()
+VALID_TITLES = frozenset(
+    {
+        "Board of County Commissioners",
+        "Board of County Commissioners Special Meeting",
+    }
+)
+VALID_STATUSES = frozenset({"tentative", "confirmed", "cancelled", "passed"})
+VALID_LINK_TITLES = frozenset(
+    {"Agenda", "Agenda Packet", "Minutes", "Other", "Document"}
+)
 
-# Parse the info page first to extract time notes
-list(spider.parse_info_page(info_page_response))
 
-# Freeze time for consistent test results
-freezer = freeze_time("2025-12-02")
-freezer.start()
+@pytest.fixture(scope="module")
+def spider():
+    spider = TulokBoccSpider()
+    # Parse the info page first to extract time notes
+    list(spider.parse_info_page(info_page_response))
+    return spider
 
-parsed_items = [item for item in spider.parse(test_response)]
 
-freezer.stop()
+@pytest.fixture(scope="module")
+def parsed_items(spider):
+    # Freeze time for consistent test results
+    with freeze_time("2025-12-02"):
+        return list(spider.parse(test_response))
 
 
-def test_first_item_properties():
+def test_first_item_properties(parsed_items):
     item = parsed_items[0]
     assert item["title"] == "Board of County Commissioners"
     assert item["start"] == datetime(2025, 12, 8, 9, 30)
@@ -53,86 +73,145 @@ def test_first_item_properties():
     )  # noqa
 
 
-def test_title_values():
-    for item in parsed_items:
-        assert item["title"] in [
-            "Board of County Commissioners",
-            "Board of County Commissioners Special Meeting",
-        ]
+def test_title_values(parsed_items):
+    assert all(item["title"] in VALID_TITLES for item in parsed_items)
 
 
-def test_description():
-    for item in parsed_items:
-        assert isinstance(item["description"], str)
+def test_description(parsed_items):
+    assert all(isinstance(item["description"], str) for item in parsed_items)
 
 
-def test_start():
-    for item in parsed_items:
-        assert isinstance(item["start"], datetime)
+def test_start(parsed_items):
+    assert all(isinstance(item["start"], datetime) for item in parsed_items)
 
 
-def test_end():
-    for item in parsed_items:
-        assert item["end"] is None or isinstance(item["end"], datetime)
+def test_end(parsed_items):
+    assert all(
+        item["end"] is None or isinstance(item["end"], datetime)
+        for item in parsed_items
+    )
 
 
-def test_time_notes():
-    for item in parsed_items:
-        assert "BOCC meets every Monday" in item["time_notes"]
-        assert "9:30 a.m." in item["time_notes"]
+def test_time_notes(parsed_items):
+    assert all("BOCC meets every Monday" in item["time_notes"] for item in parsed_items)
+    assert all("9:30 a.m." in item["time_notes"] for item in parsed_items)
 
 
-def test_parse_info_page():
+def test_parse_info_page(spider):
     """Test that time notes are correctly extracted from the info page HTML."""
-    test_spider = TulokBoccSpider()
-    list(test_spider.parse_info_page(info_page_response))
-    assert "BOCC meets every Monday" in test_spider.time_notes
-    assert "9:30 a.m." in test_spider.time_notes
-    assert "Tuesday at 8:30 a.m." in test_spider.time_notes
+    assert "BOCC meets every Monday" in spider.time_notes
+    assert "9:30 a.m." in spider.time_notes
+    assert "Tuesday at 8:30 a.m." in spider.time_notes
 
 
-def test_id_and_status():
-    for item in parsed_items:
-        assert item["id"]
-        assert item["status"] in ["tentative", "confirmed", "cancelled", "passed"]
+def test_id_and_status(parsed_items):
+    assert all(item["id"] for item in parsed_items)
+    assert all(item["status"] in VALID_STATUSES for item in parsed_items)
 
 
-def test_location():
-    for item in parsed_items:
-        assert item["location"]["name"] == "Tulsa County Headquarters Building"
-        assert isinstance(item["location"]["address"], str)
+def test_location(parsed_items):
+    assert all(
+        item["location"]["name"] == "Tulsa County Headquarters Building"
+        for item in parsed_items
+    )
+    assert all(isinstance(item["location"]["address"], str) for item in parsed_items)
 
 
-def test_source():
-    for item in parsed_items:
-        assert (
-            item["source"]
-            == "https://www2.tulsacounty.org/Legacy/agendasdetail_civic.aspx?entity=BOCC%20-%20Board%20of%20County%20Commissioners"  # noqa
-        )
+def test_source(parsed_items):
+    assert all(
+        item["source"]
+        == "https://www2.tulsacounty.org/Legacy/agendasdetail_civic.aspx?entity=BOCC%20-%20Board%20of%20County%20Commissioners"  # noqa
+        for item in parsed_items
+    )
 
 
-def test_links():
+def test_links(parsed_items):
     for item in parsed_items:
         assert isinstance(item["links"], list)
         for link in item["links"]:
             assert "href" in link and "title" in link
             assert link["href"].startswith("https://tulsacook.portal.civicclerk.com/")
-            assert link["title"] in [
-                "Agenda",
-                "Agenda Packet",
-                "Minutes",
-                "Other",
-                "Document",
-            ]  # noqa
+            assert link["title"] in VALID_LINK_TITLES
     # Future meeting (3rd item) has no published files
     assert parsed_items[2]["links"] == []
 
 
-def test_classification():
-    for item in parsed_items:
-        assert item["classification"] == BOARD
+def test_classification(parsed_items):
+    assert all(item["classification"] == BOARD for item in parsed_items)
+
+
+def test_all_day(parsed_items):
+    assert all(item["all_day"] is False for item in parsed_items)
+
 
+def api_response(body, meta=None):
+    """Build a CivicClerk API response to the request carrying `meta`."""
+    request = Request(url=EVENTS_URL, meta=meta or {})
+    return TextResponse(
+        url=EVENTS_URL, body=json.dumps(body), encoding="utf-8", request=request
+    )
 
-@pytest.mark.parametrize("item", parsed_items)
-def test_all_day(item):
-    assert item["all_day"] is False
+
+def test_parse_info_page_requests_count():
+    [request] = TulokBoccSpider().parse_info_page(info_page_response)
+    events_url = request.meta["events_url"]
+    assert events_url.startswith(
+        "https://tulsacook.api.civicclerk.com/v1/Events?"
+        "$filter=categoryId+in+(26,40)"
+        "&$orderby=startDateTime+asc,+eventName+asc&$select=id,"
+    )
+    assert request.url == f"{events_url}&$count=true&$top=0"
+
+
+def test_parse_count(spider):
+    requests = list(
+        spider.parse_count(
+            api_response({"@odata.count": 250}, meta={"events_url": EVENTS_URL})
+        )
+    )
+    assert [request.url for request in requests] == [
+        f"{EVENTS_URL}&$top=100&$skip=0",
+        f"{EVENTS_URL}&$top=100&$skip=100",
+        f"{EVENTS_URL}&$top=100&$skip=200",
+    ]
+    assert [request.meta["page_end"] for request in requests] == [100, 200, 300]
+
+
+def test_parse_count_without_count(spider):
+    [request] = spider.parse_count(
+        api_response({"value": []}, meta={"events_url": EVENTS_URL})
+    )
+    assert request.url == EVENTS_URL
+    assert "page_end" not in request.meta
+
+
+@pytest.mark.parametrize(
+    "next_query,page_end,followed",
+    [
+        # Server capped the page at 50 items, the window still has 50 left
+        ("$top=50&$skip=150", 200, True),
+        # The next page belongs to the following window
+        ("$top=100&$skip=200", 200, False),
+        # No way to tell where a skiptoken points, so stay inside the window
+        ("$skiptoken=abc", 200, False),
+        # Sequential paging without a count follows every link
+        ("$top=100&$skip=200", None, True),
+        ("$skiptoken=abc", None, True),
+    ],
+)
+def test_parse_next_link(spider, next_query, page_end, followed):
+    next_link = f"{EVENTS_URL}&{next_query}"
+    results = list(
+        spider.parse(
+            api_response(
+                {"value": [], "@odata.nextLink": next_link},
+                meta={"page_end": page_end},
+            )
+        )
+    )
+    if followed:
+        [request] = results
+        assert request.url == next_link
+        assert request.meta["page_end"] == page_end
+    else:
+        assert results == []
@@ -5,77 +5,84 @@ Tests for tulok_boed spider.
 from datetime import datetime
 from os.path import dirname, join
 
+import pytest
 from city_scrapers_core.constants import BOARD
 from city_scrapers_core.utils import file_response
 from freezegun import freeze_time
 
 from city_scrapers.spiders.tulok_boed import TulokBoedSpider
 
+FILES_DIR = join(dirname(__file__), "files")
+
 test_response = file_response(
-    join(dirname(__file__), "files", "tulok_boed.json"),
+    join(FILES_DIR, "tulok_boed.json"),
     url="https://tulsaschools.diligent.community/Services/MeetingsService.svc/meetings?from=2024-12-01&to=9999-12-31",  # noqa
 )
-spider = TulokBoedSpider()
 
-freezer = freeze_time("2025-12-09")
-freezer.start()
-parsed_items = [item for item in spider.parse(test_response)]
-freezer.stop()
 
-parsed_item = parsed_items[0]
+@pytest.fixture(scope="module")
+def parsed_items():
+    spider = TulokBoedSpider()
+    with freeze_time("2025-12-09"):
+        return list(spider.parse(test_response))
+
+
+@pytest.fixture(scope="module")
+def parsed_item(parsed_items):
+    return parsed_items[0]
 
 
-def test_count():
+def test_count(parsed_items):
     assert len(parsed_items) == 56
 
 
-def test_title():
+def test_title(parsed_item):
     assert parsed_item["title"] == "Regular Meeting"
 
 
-def test_description():
+def test_description(parsed_item):
     assert parsed_item["description"] == ""
 
 
-def test_classification():
+def test_classification(parsed_item):
     assert parsed_item["classification"] == BOARD
 
 
-def test_start():
+def test_start(parsed_item):
     assert parsed_item["start"] == datetime(2026, 12, 14, 17, 30)
 
 
-def test_end():
+def test_end(parsed_item):
     assert parsed_item["end"] is None
 
 
-def test_time_notes():
+def test_time_notes(parsed_item):
     assert parsed_item["time_notes"] == ""
 
 
-def test_id():
+def test_id(parsed_item):
     assert parsed_item["id"] == "tulok_boed/202612141730/x/regular_meeting"
 
 
-def test_status():
+def test_status(parsed_item):
     assert parsed_item["status"] == "tentative"
 
 
-def test_location():
+def test_location(parsed_item):
     assert parsed_item["location"] == {
         "name": "Cheryl Selman Room, Charles C. Mason Education Service Center",
         "address": "3027 S. New Haven Ave., Tulsa OK",
     }
 
 
-def test_source():
+def test_source(parsed_item):
     assert (
         parsed_item["source"]
         == "https://tulsaschools.diligent.community/Portal/MeetingInformation.aspx?Org=Cal&Id=213"  # noqa
     )
 
 
-def test_links():
+def test_links(parsed_item):
     assert parsed_item["links"] == [
         {
             "href": "https://tulsaschools.diligent.community/Portal/MeetingInformation.aspx?Org=Cal&Id=213",  # noqa
@@ -84,5 +91,5 @@ def test_links():
     ]
 
 
-def test_all_day():
+def test_all_day(parsed_item):
     assert parsed_item["all_day"] is False
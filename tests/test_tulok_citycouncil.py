@@ -2,7 +2,9 @@
 Tests for Tulsa City Council spider.
 """
 
+from bisect import bisect_left
 from datetime import datetime
+from operator import itemgetter
 from os.path import dirname, join
 
 import pytest
@@ -12,6 +14,8 @@ from freezegun import freeze_time
 
 from city_scrapers.spiders.tulok_citycouncil import TulsaGranicusCityCouncilSpider
 
+FILES_DIR = join(dirname(__file__), "files")
+
 # Constants for test validation
 # Updated to include committee meetings (Council Urban & Economic Development,
 # Council Budget & Special Projects, Council Public Works)
@@ -19,13 +23,34 @@ EXPECTED_TOTAL_MEETINGS = 17
 EXPECTED_HISTORICAL_MEETINGS = 13
 EXPECTED_UPCOMING_MEETINGS = 4  # 2 Council + 2 Committee meetings
 SOURCE_URL = "https://tulsa-ok.granicus.com/ViewPublisher.php?view_id=4"
+UPCOMING_START = datetime(2025, 12, 1)
+# Exact values expected on the first (oldest) meeting
+FIRST_MEETING_FIELDS = {
+    "title": "Regular Meeting",
+    "description": "",
+    "classification": CITY_COUNCIL,
+    "status": PASSED,
+    "time_notes": "",
+    "end": None,
+    # Based on "October 12, 2016 - 5:00 PM"
+    "start": datetime(2016, 10, 12, 17, 0),
+    "source": SOURCE_URL,
+}
+VALID_CLASSIFICATIONS = frozenset({CITY_COUNCIL, COMMITTEE})
+EXPECTED_COMMITTEES = frozenset(
+    {
+        "Council Urban & Economic Development Committee",
+        "Council Budget & Special Projects Committee",
+        "Council Public Works Committee",
+    }
+)
 
 
 @pytest.fixture(scope="module")
 def parsed_items():
     """Parse test HTML file once and reuse for all tests."""
     test_response = file_response(
-        join(dirname(__file__), "files", "tulok_citycouncil.html"),
+        join(FILES_DIR, "tulok_citycouncil.html"),
         url=SOURCE_URL,
     )
     spider = TulsaGranicusCityCouncilSpider()
@@ -33,6 +58,39 @@ def parsed_items():
         return list(spider.parse(test_response))
 
 
+@pytest.fixture(scope="module")
+def items_by_start(parsed_items):
+    return sorted(parsed_items, key=itemgetter("start"))
+
+
+@pytest.fixture(scope="module")
+def upcoming_index(items_by_start):
+    """Position of the first meeting starting on or after UPCOMING_START."""
+    return bisect_left(items_by_start, UPCOMING_START, key=itemgetter("start"))
+
+
+@pytest.fixture(scope="module")
+def historical_items(items_by_start, upcoming_index):
+    """Meetings starting before UPCOMING_START, sorted by start."""
+    return items_by_start[:upcoming_index]
+
+
+@pytest.fixture(scope="module")
+def upcoming_items(items_by_start, upcoming_index):
+    """Meetings starting on or after UPCOMING_START, sorted by start."""
+    return items_by_start[upcoming_index:]
+
+
+@pytest.fixture(scope="module")
+def special_items(parsed_items):
+    return [item for item in parsed_items if "Special" in item["title"]]
+
+
+@pytest.fixture(scope="module")
+def committee_items(parsed_items):
+    return [item for item in parsed_items if "Committee" in item["title"]]
+
+
 class TestMeetingCounts:
     """Test meeting counts and distribution."""
 
@@ -46,24 +104,11 @@ class TestMeetingCounts:
         # (e.g., Human Rights Commission) are filtered out
         assert len(parsed_items) == EXPECTED_TOTAL_MEETINGS
 
-    def test_historical_vs_upcoming_split(self, parsed_items):
+    def test_historical_vs_upcoming_split(self, historical_items, upcoming_items):
         """Test that historical and upcoming meetings are correctly split."""
-        historical = [
-            item
-            for item in parsed_items
-            if item["start"].year < 2025
-            or (item["start"].year == 2025 and item["start"].month < 12)
-        ]
-        upcoming = [
-            item
-            for item in parsed_items
-            if (item["start"].year == 2025 and item["start"].month == 12)
-            or (item["start"].year == 2026)
-        ]
-
-        assert len(historical) == EXPECTED_HISTORICAL_MEETINGS
-        assert len(upcoming) == EXPECTED_UPCOMING_MEETINGS
-        assert len(historical) + len(upcoming) == EXPECTED_TOTAL_MEETINGS
+        assert len(historical_items) == EXPECTED_HISTORICAL_MEETINGS
+        assert len(upcoming_items) == EXPECTED_UPCOMING_MEETINGS
+        assert len(historical_items) + len(upcoming_items) == EXPECTED_TOTAL_MEETINGS
 
     def test_years_coverage(self, parsed_items):
         """Test that meetings span multiple years."""
@@ -80,24 +125,16 @@ class TestMeetingStructure:
         """Test that the first meeting has all required fields with correct values."""
         meeting = parsed_items[0]
 
-        # Basic fields
-        assert meeting["title"] == "Regular Meeting"
-        assert meeting["description"] == ""
-        assert meeting["classification"] == CITY_COUNCIL
-        assert meeting["status"] == PASSED
+        assert {
+            field: meeting[field] for field in FIRST_MEETING_FIELDS
+        } == FIRST_MEETING_FIELDS
         assert meeting["all_day"] is False
-        assert meeting["time_notes"] == ""
-        assert meeting["end"] is None
-
-        # Date/time - Based on "October 12, 2016 - 5:00 PM"
-        assert meeting["start"] == datetime(2016, 10, 12, 17, 0)
 
         # Location
         assert meeting["location"]["name"] == "City Hall"
         assert "175 E 2nd St" in meeting["location"]["address"]
 
-        # Source and ID
-        assert meeting["source"] == SOURCE_URL
+        # ID
         assert meeting["id"] is not None
         assert "tulok_citycouncil" in meeting["id"]
 
@@ -107,7 +144,7 @@ class TestMeetingStructure:
             assert meeting["title"]
             assert meeting["start"] is not None
             # Classification should be either CITY_COUNCIL or COMMITTEE
-            assert meeting["classification"] in [CITY_COUNCIL, COMMITTEE]
+            assert meeting["classification"] in VALID_CLASSIFICATIONS
             assert meeting["source"] == SOURCE_URL
             assert meeting["location"]["name"] == "City Hall"
             assert "175 E 2nd St" in meeting["location"]["address"]
@@ -123,62 +160,50 @@ class TestMeetingLinks:
         links = parsed_items[0]["links"]
         assert len(links) == 2
 
+        hrefs = {link["title"]: link["href"] for link in links}
+        assert hrefs.keys() == {"Agenda", "Video"}
+
         # Check for agenda link
-        agenda_link = next((link for link in links if link["title"] == "Agenda"), None)
-        assert agenda_link is not None
-        assert "AgendaViewer.php" in agenda_link["href"]
-        assert agenda_link["href"].startswith("https://")
+        assert "AgendaViewer.php" in hrefs["Agenda"]
+        assert hrefs["Agenda"].startswith("https://")
 
         # Check for video link
-        video_link = next((link for link in links if link["title"] == "Video"), None)
-        assert video_link is not None
-        assert "MediaPlayer.php" in video_link["href"]
-        assert video_link["href"].startswith("https://")
+        assert "MediaPlayer.php" in hrefs["Video"]
+        assert hrefs["Video"].startswith("https://")
 
-    def test_upcoming_event_links_use_event_id(self, parsed_items):
+    def test_upcoming_event_links_use_event_id(self, upcoming_items):
         """Test that upcoming event agenda links use event_id (not clip_id)."""
         upcoming_with_agenda = next(
-            (
-                item
-                for item in parsed_items
-                if item["start"].year >= 2025
-                and item["start"].month == 12
-                and item["links"]
-            ),
+            (item for item in upcoming_items if item["links"]),
             None,
         )
 
         if upcoming_with_agenda:
-            agenda_link = next(
-                (
-                    link
-                    for link in upcoming_with_agenda["links"]
-                    if link["title"] == "Agenda"
-                ),
-                None,
-            )
-            if agenda_link:
-                assert "event_id" in agenda_link["href"]
-                assert agenda_link["href"].startswith("https://")
+            hrefs = {
+                link["title"]: link["href"] for link in upcoming_with_agenda["links"]
+            }
+            agenda_href = hrefs.get("Agenda")
+            if agenda_href:
+                assert "event_id" in agenda_href
+                assert agenda_href.startswith("https://")
 
 
 class TestMeetingFiltering:
     """Test that meetings are correctly filtered."""
 
-    def test_special_meetings_included(self, parsed_items):
+    def test_special_meetings_included(self, special_items):
         """Test that special meetings are properly included and titled."""
-        special_meetings = [item for item in parsed_items if "Special" in item["title"]]
-        assert len(special_meetings) >= 1
+        assert len(special_items) >= 1
 
         # All special meetings should be CITY_COUNCIL classification
-        for meeting in special_meetings:
+        for meeting in special_items:
             assert meeting["classification"] == CITY_COUNCIL
 
         # Check specific special meeting in December exists
         special_dec = next(
             (
                 item
-                for item in parsed_items
+                for item in special_items
                 if "Council Special Meeting" in item["title"]
                 and item["start"].month == 12
             ),
@@ -186,27 +211,19 @@ class TestMeetingFiltering:
         )
         assert special_dec is not None
 
-    def test_committee_meetings_included(self, parsed_items):
+    def test_committee_meetings_included(self, committee_items):
         """Test that City Council committee meetings are included."""
         # Check that committee meetings ARE in parsed items
-        committee_meetings = [
-            item for item in parsed_items if "Committee" in item["title"]
-        ]
-        assert len(committee_meetings) >= 1
+        assert len(committee_items) >= 1
 
         # All committee meetings should have COMMITTEE classification
-        for meeting in committee_meetings:
+        for meeting in committee_items:
             assert meeting["classification"] == COMMITTEE
 
         # Verify specific committee meetings are present
-        committee_names = {item["title"] for item in committee_meetings}
+        committee_names = {item["title"] for item in committee_items}
         # At least one of the expected committees should be present
-        expected_committees = [
-            "Council Urban & Economic Development Committee",
-            "Council Budget & Special Projects Committee",
-            "Council Public Works Committee",
-        ]
-        assert any(name in committee_names for name in expected_committees)
+        assert not EXPECTED_COMMITTEES.isdisjoint(committee_names)
 
     def test_non_city_council_meetings_filtered(self, parsed_items):
         """Test that non-City-Council meetings (not committees) are filtered out."""
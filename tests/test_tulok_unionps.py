@@ -6,53 +6,70 @@ from city_scrapers_core.constants import BOARD
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.utils import file_response
 from freezegun import freeze_time
+from scrapy.http import HtmlResponse
 
 from city_scrapers.spiders.tulok_unionps import TulokUnionpsSpider
 
+FILES_DIR = join(dirname(__file__), "files")
+
+VALID_TITLES = frozenset(
+    {"Board of Education Meeting", "Board of Education Special Meeting"}
+)
+VALID_STATUSES = frozenset({"tentative", "confirmed", "cancelled", "passed"})
+VALID_LINK_TITLES = frozenset({"Agenda", "Minutes", "Board Report", "Video"})
+
 # Load local HTML file for testing
 test_response = file_response(
-    join(dirname(__file__), "files", "tulok_unionps.html"),
+    join(FILES_DIR, "tulok_unionps.html"),
     url="https://www.unionps.org/about/board-of-education/agendas-and-minutes",
 )
-spider = TulokUnionpsSpider()
 
-freezer = freeze_time("2025-11-25")
-freezer.start()
 
-parsed_items = []
-board_report_requests = []
-
-# Run spider.parse() → yields only a Request
-for req in spider.parse(test_response):
-    board_page = file_response(
-        join(dirname(__file__), "files", "tulok_unionps_board.html"),
-        url="https://www.unionps.org/about/board-of-education",
-    )
-    board_page.meta["main_page"] = test_response
-
-    # Collect meetings + requests
-    for item in spider.parse_board_page(board_page):
-        if isinstance(item, Meeting):
-            parsed_items.append(item)
-        else:
-            board_report_requests.append(item)
-
-# Follow board report pages and collect the meetings they yield
-for board_req in board_report_requests:
-    board_report_page = file_response(
-        join(dirname(__file__), "files", "tulok_unionps_board_report.html"),
-        url=board_req.url,
-    )
-    board_report_page.meta.update(board_req.meta)
+@pytest.fixture(scope="module")
+def spider():
+    return TulokUnionpsSpider()
+
+
+@pytest.fixture(scope="module")
+def parsed_items(spider):
+    parsed_items = []
+    board_report_requests = []
+
+    with freeze_time("2025-11-25"):
+        # Run spider.parse() → yields only a Request
+        for req in spider.parse(test_response):
+            board_page = file_response(
+                join(FILES_DIR, "tulok_unionps_board.html"),
+                url="https://www.unionps.org/about/board-of-education",
+            )
+            board_page.meta["main_page"] = test_response
+
+            # Collect meetings + requests
+            for item in spider.parse_board_page(board_page):
+                if isinstance(item, Meeting):
+                    parsed_items.append(item)
+                else:
+                    board_report_requests.append(item)
+
+        # Follow board report pages and collect the meetings they yield. Every
+        # report uses the same fixture, so read it once and attach each request
+        board_report_page = file_response(
+            join(FILES_DIR, "tulok_unionps_board_report.html"),
+            url="https://www.unionps.org/",
+        )
+        for board_req in board_report_requests:
+            report_response = board_report_page.replace(
+                url=board_req.url, request=board_req
+            )
 
-    for meeting_item in spider.parse_board_report(board_report_page):
-        if isinstance(meeting_item, Meeting):
-            parsed_items.append(meeting_item)
+            for meeting_item in spider.parse_board_report(report_response):
+                if isinstance(meeting_item, Meeting):
+                    parsed_items.append(meeting_item)
 
-freezer.stop()
+    return parsed_items
 
 
-def test_first_item_properties():
+def test_first_item_properties(spider, parsed_items):
     item = parsed_items[0]
     assert item["title"] == "Board of Education Special Meeting"
     assert item["start"] == datetime(2025, 3, 13, 19, 0)
@@ -69,44 +86,39 @@ def test_first_item_properties():
     assert href.startswith("https://www.unionps.org/fs/resource-manager/view/")
 
 
-def test_title_values():
-    allowed_titles = {
-        "Board of Education Meeting",
-        "Board of Education Special Meeting",
-    }
-
+def test_title_values(parsed_items):
     for item in parsed_items:
-        assert item["title"] in allowed_titles
+        assert item["title"] in VALID_TITLES
 
 
-def test_description():
+def test_description(parsed_items):
     for item in parsed_items:
         assert isinstance(item["description"], str)
 
 
-def test_start():
+def test_start(parsed_items):
     for item in parsed_items:
         assert isinstance(item["start"], datetime)
 
 
-def test_end():
+def test_end(parsed_items):
     for item in parsed_items:
         assert item["end"] is None
 
 
-def test_time_notes():
+def test_time_notes(parsed_items):
     for item in parsed_items:
         assert isinstance(item["time_notes"], str)
         assert item["time_notes"] != ""
 
 
-def test_id_and_status():
+def test_id_and_status(parsed_items):
     for item in parsed_items:
         assert item["id"]
-        assert item["status"] in ["tentative", "confirmed", "cancelled", "passed"]
+        assert item["status"] in VALID_STATUSES
 
 
-def test_location():
+def test_location(parsed_items):
     for item in parsed_items:
         assert item["location"] == {
             "name": "Union Public Schools Education Service Center",
@@ -114,7 +126,7 @@ def test_location():
         }
 
 
-def test_source():
+def test_source(parsed_items):
     for item in parsed_items:
         assert (
             item["source"]
@@ -122,27 +134,44 @@ def test_source():
         )
 
 
-def test_links():
+def test_links(parsed_items):
     for item in parsed_items:
         assert isinstance(item["links"], list)
         for link in item["links"]:
             assert "href" in link and "title" in link
             assert link["href"]
-            assert link["title"] in ["Agenda", "Minutes", "Board Report", "Video"]
+            assert link["title"] in VALID_LINK_TITLES
 
 
-def test_meetings_have_video():
+def test_meetings_have_video(parsed_items):
     """Test that at least some meetings have video links"""
     assert any(
         link["title"] == "Video" for item in parsed_items for link in item["links"]
     )
 
 
-def test_classification():
+def test_classification(parsed_items):
     for item in parsed_items:
         assert item["classification"] == BOARD
 
 
-@pytest.mark.parametrize("item", parsed_items)
-def test_all_day(item):
-    assert item["all_day"] is False
+def test_all_day(parsed_items):
+    assert all(item["all_day"] is False for item in parsed_items)
+
+
+def test_collect_sources_first_date_per_line(spider):
+    main_page = HtmlResponse(
+        url="https://www.unionps.org/about/board-of-education/agendas-and-minutes",
+        body=(
+            b"<section id='fsEl_23350'><div class='fsStyleColumn'>"
+            b"<p>March 16, 2026 (moved from March 9, 2026)<br>"
+            b"April 13, 2026\nMay 11, 2026<br>No meeting in July</p>"
+            b"</div></section>"
+        ),
+        encoding="utf-8",
+    )
+    assert spider._collect_sources(main_page) == [
+        ("March 16, 2026", None),
+        ("April 13, 2026", None),
+        ("May 11, 2026", None),
+    ]
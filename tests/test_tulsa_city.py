@@ -0,0 +1,86 @@
+"""
+Tests for behavior shared by the Tulsa City spiders through TulsaCityMixin.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from freezegun import freeze_time
+from scrapy.http import TextResponse
+
+from city_scrapers.spiders import tulsa_city
+
+TulokAuditCommitteeSpider = tulsa_city.TulokAuditCommitteeSpider
+
+
+@pytest.fixture(scope="module")
+def spider():
+    return TulokAuditCommitteeSpider()
+
+
+@pytest.mark.parametrize(
+    "meeting_time,expected",
+    [
+        ("5:00PM", datetime(2025, 11, 20, 17, 0)),
+        ("5:00 PM", datetime(2025, 11, 20, 17, 0)),
+        ("11:30am", datetime(2025, 11, 20, 11, 30)),
+        ("12:15AM", datetime(2025, 11, 20, 0, 15)),
+        # Unparseable or missing times fall back to midnight
+        ("TBD", datetime(2025, 11, 20)),
+        ("", datetime(2025, 11, 20)),
+    ],
+)
+def test_parse_start(spider, meeting_time, expected):
+    item = {"Meeting_Date": "11/20/2025", "Meeting_Time": meeting_time}
+    assert spider._parse_start(item) == expected
+
+
+def test_filter_meetings_data_keeps_last_duplicate(spider):
+    meetings = [
+        {"Agenda_ID": 1, "Meeting_Date": "01/08/2026", "Meeting_Time": "12:00PM"},
+        {"Agenda_ID": 2, "Meeting_Date": "02/12/2026", "Meeting_Time": "12:00PM"},
+        # Same date and time as the first meeting, but not adjacent to it
+        {"Agenda_ID": 3, "Meeting_Date": "01/08/2026 ", "Meeting_Time": "12:00PM"},
+        # Same date at a different time is a separate meeting
+        {"Agenda_ID": 4, "Meeting_Date": "01/08/2026", "Meeting_Time": "5:00PM"},
+    ]
+    response = TextResponse(
+        url=spider.api_url, body=json.dumps(meetings), encoding="utf-8"
+    )
+
+    filtered = spider.filter_meetings_data(response)
+
+    # The last instance replaces the first one, in the first one's position
+    assert [meeting["Agenda_ID"] for meeting in filtered] == [3, 2, 4]
+
+
+@pytest.mark.parametrize(
+    "api_first", [True, False], ids=["api_first", "upcoming_first"]
+)
+def test_start_requests_either_order(
+    api_first, audit_committee_api_response, upcoming_meetings_response
+):
+    spider = TulokAuditCommitteeSpider()
+    api_request, upcoming_request = spider.start_requests()
+    assert api_request.callback == spider.parse_api
+    assert upcoming_request.callback == spider.parse_upcoming
+
+    responses = [
+        audit_committee_api_response.replace(url=api_request.url, request=api_request),
+        upcoming_meetings_response.replace(
+            url=upcoming_request.url, request=upcoming_request
+        ),
+    ]
+    if not api_first:
+        responses.reverse()
+    first, second = responses
+
+    with freeze_time("2026-01-09"):
+        # Nothing can be parsed until both responses have arrived
+        assert list(first.request.callback(first)) == []
+        items = list(second.request.callback(second))
+
+    assert len(items) == 132
+    assert items[0]["start"] == datetime(2025, 11, 20, 11, 30)
+    assert spider._sources == {}